@@ -0,0 +1,241 @@
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from strongconnect import tarjan_scc
+from find_example_solution import find_example_solution
+from topologicalsort import topological_sort_sccs
+from solver import create_implication_graph, check_satisfiability
+
+# Maximum number of solved components kept in the cache
+CACHE_SIZE = 10000
+
+# Formulas with fewer clauses than this are solved in-process, since the
+# worker start-up and pickling would cost more than they save
+PARALLEL_THRESHOLD = 50000
+
+# Solved components, keyed by the hash of their canonical (renumbered) form,
+# least recently used first. Values are (is_satisfiable, local_solution) pairs.
+_component_cache = OrderedDict()
+
+
+def _find(parent, x):
+    """Find the representative of x, compressing the path on the way."""
+    root = x
+    while parent[root] != root:
+        root = parent[root]
+    while parent[x] != root:
+        parent[x], x = root, parent[x]
+    return root
+
+
+def _union(parent, rank, a, b):
+    """Merge the sets containing a and b (union by rank)."""
+    root_a = _find(parent, a)
+    root_b = _find(parent, b)
+    if root_a == root_b:
+        return
+    if rank[root_a] < rank[root_b]:
+        root_a, root_b = root_b, root_a
+    parent[root_b] = root_a
+    if rank[root_a] == rank[root_b]:
+        rank[root_a] += 1
+
+
+def find_components(num_vars, clauses):
+    """
+    Split a 2SAT formula into variable-disjoint components.
+
+    Args:
+        num_vars: Number of variables in the formula
+        clauses: List of clauses, each a pair of literals
+
+    Returns:
+        components: List of (variables, clauses) pairs, one for every group of
+            variables that share at least one clause. Variables that do not
+            appear in any clause are left out.
+    """
+    parent = list(range(num_vars + 1))
+    rank = [0] * (num_vars + 1)
+
+    for a, b in clauses:
+        _union(parent, rank, abs(a), abs(b))
+
+    groups = {}
+    for clause in clauses:
+        root = _find(parent, abs(clause[0]))
+        if root not in groups:
+            groups[root] = (set(), [])
+        variables, component_clauses = groups[root]
+        variables.update((abs(clause[0]), abs(clause[1])))
+        component_clauses.append(clause)
+
+    return [(sorted(variables), component_clauses) for variables, component_clauses in groups.values()]
+
+
+def _canonicalize(variables, clauses):
+    """Renumber a component's variables to 1..k so equal components hash equally."""
+    local_index = {var: i + 1 for i, var in enumerate(variables)}
+    local_clauses = []
+    for a, b in clauses:
+        local_a = local_index[abs(a)] if a > 0 else -local_index[abs(a)]
+        local_b = local_index[abs(b)] if b > 0 else -local_index[abs(b)]
+        local_clauses.append((local_a, local_b))
+    return len(variables), local_clauses
+
+
+def component_key(num_local_vars, local_clauses):
+    """Hash of a canonical component, used as the cache key."""
+    text = f"{num_local_vars}\n" + ";".join(f"{a} {b}" for a, b in local_clauses)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def solve_component(num_local_vars, local_clauses):
+    """
+    Solve a single canonical component.
+
+    Returns:
+        (is_satisfiable, solution): solution maps local variables 1..k to
+            their truth values, or is None when the component is unsatisfiable.
+    """
+    graph = create_implication_graph(num_local_vars, local_clauses)
+    sccs = tarjan_scc(graph)
+    if not check_satisfiability(num_local_vars, sccs):
+        return False, None
+
+    sorted_scc_indices = topological_sort_sccs(graph, sccs)
+    return True, find_example_solution(sccs, sorted_scc_indices, num_local_vars)
+
+
+def _cache_get(key):
+    """Return the cached result for key (marking it recently used), or None."""
+    result = _component_cache.get(key)
+    if result is not None:
+        _component_cache.move_to_end(key)
+    return result
+
+
+def _cache_put(key, result):
+    """Cache a component result, evicting the least recently used ones past CACHE_SIZE."""
+    _component_cache[key] = result
+    _component_cache.move_to_end(key)
+    while len(_component_cache) > CACHE_SIZE:
+        _component_cache.popitem(last=False)
+
+
+def solve_components(batch):
+    """
+    Solve a batch of canonical components, stopping at the first unsatisfiable one.
+
+    Args:
+        batch: List of (key, num_local_vars, local_clauses) triples
+
+    Returns:
+        results: List of (key, (is_satisfiable, solution)) pairs for the
+            components solved so far
+    """
+    results = []
+    for key, num_local_vars, local_clauses in batch:
+        result = solve_component(num_local_vars, local_clauses)
+        results.append((key, result))
+        if not result[0]:
+            break
+    return results
+
+
+def _make_batches(pending, num_batches):
+    """Split the pending components into batches with roughly equal numbers of clauses."""
+    batches = [[] for _ in range(num_batches)]
+    loads = [0] * num_batches
+
+    # Largest components first, each into the currently lightest batch
+    for item in sorted(pending, key=lambda item: len(item[2]), reverse=True):
+        lightest = loads.index(min(loads))
+        batches[lightest].append(item)
+        loads[lightest] += len(item[2])
+
+    return [batch for batch in batches if batch]
+
+
+def _store_results(batch_results, results):
+    """Record a batch's results; returns False if one of them is unsatisfiable."""
+    for key, result in batch_results:
+        _cache_put(key, result)
+        results[key] = result
+        if not result[0]:
+            return False
+    return True
+
+
+def solve_by_components(num_vars, clauses, max_workers=None):
+    """
+    Solve a 2SAT formula component by component.
+
+    Each variable-disjoint component is solved on its own and the results are
+    merged into one global solution. Large formulas are split into about
+    max_workers batches of components that are solved in parallel. Solved
+    components are cached, so a formula that changes in one group only
+    re-solves that group.
+
+    Args:
+        num_vars: Number of variables in the formula
+        clauses: List of clauses, each a pair of literals
+        max_workers: Maximum number of worker processes (defaults to the
+            number of CPUs)
+
+    Returns:
+        (is_satisfiable, solution): solution maps every variable 1..num_vars
+            to its truth value, or is None when the formula is unsatisfiable.
+    """
+    results = {}
+    pending = {}
+    components = []
+    for variables, component_clauses in find_components(num_vars, clauses):
+        num_local_vars, local_clauses = _canonicalize(variables, component_clauses)
+        key = component_key(num_local_vars, local_clauses)
+        components.append((variables, key))
+        if key in results or key in pending:
+            continue
+
+        cached = _cache_get(key)
+        if cached is None:
+            pending[key] = (num_local_vars, local_clauses)
+        elif not cached[0]:
+            return False, None
+        else:
+            results[key] = cached
+
+    pending = [(key, num_local_vars, local_clauses) for key, (num_local_vars, local_clauses) in pending.items()]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    total_clauses = sum(len(item[2]) for item in pending)
+
+    if max_workers == 1 or len(pending) <= 1 or total_clauses < PARALLEL_THRESHOLD:
+        if not _store_results(solve_components(pending), results):
+            return False, None
+    else:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(solve_components, batch) for batch in _make_batches(pending, max_workers)]
+            for future in as_completed(futures):
+                if not _store_results(future.result(), results):
+                    # Stop at the first unsatisfiable component
+                    return False, None
+        finally:
+            # Cancel queued batches and don't wait for the running ones
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # Merge the per-component assignments; unconstrained variables default to False
+    solution = {var: False for var in range(1, num_vars + 1)}
+    for variables, key in components:
+        local_solution = results[key][1]
+        for i, var in enumerate(variables):
+            solution[var] = local_solution[i + 1]
+
+    return True, solution
+
+
+def clear_component_cache():
+    """Forget all cached component results."""
+    _component_cache.clear()
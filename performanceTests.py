@@ -7,8 +7,12 @@ import sys
 
 # Import your 2SAT solver modules
 sys.path.append('.')  # Ensure current directory is in path
-from main import parse_input, create_implication_graph, check_satisfiability
+from solver import create_implication_graph, check_satisfiability
 from strongconnect import tarjan_scc
+from topologicalsort import topological_sort_sccs
+from find_example_solution import find_example_solution
+from verify import verify
+from decomposition import solve_by_components, clear_component_cache
 
 
 def generate_random_2sat(num_literals, num_clauses):
@@ -35,26 +39,58 @@ def generate_random_2sat(num_literals, num_clauses):
     return f"{num_literals}\n{';'.join(clauses)}"
 
 
-def solve_2sat(problem_str):
-    """Solve a 2SAT problem and return whether it's satisfiable and the execution time."""
+def solve_2sat(problem_str, verify_solution=False, decompose=False):
+    """
+    Solve a 2SAT problem and return whether it's satisfiable and the execution time.
+
+    When decompose is set, the problem is solved component by component with
+    solve_by_components, starting from an empty component cache. That path
+    always builds an example solution, so its execution time includes it.
+
+    When verify_solution is set, an example solution of a satisfiable problem is
+    checked against every clause. Whether it passed and the cost of the check are
+    returned separately (both None when nothing was verified); the cost is not
+    part of the execution time.
+    """
+    if decompose:
+        clear_component_cache()
+
     start_time = time.time()
 
     # Parse the problem
     num_literals, clauses = parse_input_from_string(problem_str)
 
-    # Create implication graph
-    graph = create_implication_graph(num_literals, clauses)
+    if decompose:
+        # Solve each variable-disjoint component independently
+        is_satisfiable, solution = solve_by_components(num_literals, clauses)
+    else:
+        # Create implication graph
+        graph = create_implication_graph(num_literals, clauses)
 
-    # Find strongly connected components
-    sccs = tarjan_scc(graph)
+        # Find strongly connected components
+        sccs = tarjan_scc(graph)
 
-    # Check satisfiability
-    is_satisfiable = check_satisfiability(num_literals, sccs)
+        # Check satisfiability
+        is_satisfiable = check_satisfiability(num_literals, sccs)
 
     end_time = time.time()
     execution_time = end_time - start_time
 
-    return is_satisfiable, execution_time
+    verify_time = None
+    passed = None
+    if verify_solution and is_satisfiable:
+        if not decompose:
+            sorted_scc_indices = topological_sort_sccs(graph, sccs)
+            solution = find_example_solution(sccs, sorted_scc_indices, num_literals)
+
+        start_time = time.time()
+        passed, violated = verify(num_literals, clauses, solution)
+        verify_time = time.time() - start_time
+
+        if not passed:
+            print(f"  Verification failed, violated clauses: {violated.tolist()}")
+
+    return is_satisfiable, execution_time, verify_time, passed
 
 
 def parse_input_from_string(problem_str):
@@ -71,8 +107,8 @@ def parse_input_from_string(problem_str):
     return num_literals, clauses
 
 
-def run_tests(num_tests, literals_list, clauses_list):
-    """Run tests for all combinations of literals and clauses."""
+def run_tests(num_tests, literals_list, clauses_list, verify_solutions=False, decompose=False):
+    """Run tests for all combinations of literals and clauses, optionally verifying the solutions."""
     results = []
 
     total_tests = len(literals_list) * len(clauses_list)
@@ -84,13 +120,19 @@ def run_tests(num_tests, literals_list, clauses_list):
             print(f"Running tests for {num_literals} literals, {num_clauses} clauses ({test_count}/{total_tests})...")
 
             times = []
+            verify_times = []
+            verify_failures = 0
             satisfiable_count = 0
 
             for i in range(num_tests):
                 problem = generate_random_2sat(num_literals, num_clauses)
-                is_satisfiable, execution_time = solve_2sat(problem)
+                is_satisfiable, execution_time, verify_time, passed = solve_2sat(problem, verify_solutions, decompose)
 
                 times.append(execution_time)
+                if verify_time is not None:
+                    verify_times.append(verify_time)
+                    if not passed:
+                        verify_failures += 1
                 if is_satisfiable:
                     satisfiable_count += 1
 
@@ -102,6 +144,7 @@ def run_tests(num_tests, literals_list, clauses_list):
             min_time = min(times)
             max_time = max(times)
             satisfiable_percent = (satisfiable_count / num_tests) * 100
+            avg_verify_time = statistics.mean(verify_times) if verify_times else None
 
             result = {
                 'literals': num_literals,
@@ -109,18 +152,24 @@ def run_tests(num_tests, literals_list, clauses_list):
                 'avg_time': avg_time,
                 'min_time': min_time,
                 'max_time': max_time,
-                'satisfiable_percent': satisfiable_percent
+                'satisfiable_percent': satisfiable_percent,
+                'avg_verify_time': avg_verify_time,
+                'verified_count': len(verify_times),
+                'verify_failures': verify_failures
             }
 
             results.append(result)
             print(f"  Average time: {avg_time:.6f} seconds")
             print(f"  Satisfiable: {satisfiable_percent:.2f}%")
+            if avg_verify_time is not None:
+                print(f"  Average verification time: {avg_verify_time:.6f} seconds")
+                print(f"  Failed verification: {verify_failures}/{len(verify_times)}")
             print()
 
     return results
 
 
-def save_results(results, output_file=None):
+def save_results(results, output_file=None, decompose=False):
     """Save test results to a file."""
     if output_file is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -129,7 +178,8 @@ def save_results(results, output_file=None):
     with open(output_file, 'w') as f:
         f.write("2SAT Solver Performance Test Results\n")
         f.write("===================================\n\n")
-        f.write(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        f.write(f"Solver: {'component decomposition' if decompose else 'single implication graph'}\n\n")
 
         f.write("Summary:\n")
         f.write("-" * 80 + "\n")
@@ -141,6 +191,17 @@ def save_results(results, output_file=None):
             f.write(
                 f"{result['literals']:<10}{result['clauses']:<10}{result['avg_time']:<15.6f}{result['min_time']:<15.6f}{result['max_time']:<15.6f}{result['satisfiable_percent']:<15.2f}\n")
 
+        verified = [result for result in results if result.get('avg_verify_time') is not None]
+        if verified:
+            f.write("\nVerification:\n")
+            f.write("-" * 80 + "\n")
+            f.write(f"{'Literals':<10}{'Clauses':<10}{'Avg Verify Time (s)':<20}{'Verified':<10}{'Failed':<10}\n")
+            f.write("-" * 80 + "\n")
+
+            for result in verified:
+                f.write(
+                    f"{result['literals']:<10}{result['clauses']:<10}{result['avg_verify_time']:<20.6f}{result['verified_count']:<10}{result['verify_failures']:<10}\n")
+
     print(f"Results saved to {output_file}")
     return output_file
 
@@ -162,10 +223,13 @@ def main():
         if not output_file:
             output_file = None
 
+        verify_solutions = input("Verify the solutions? (y/n): ").strip().lower() == 'y'
+        decompose = input("Solve by independent components? (y/n): ").strip().lower() == 'y'
+
         print("\nRunning tests...")
-        results = run_tests(num_tests, literals_list, clauses_list)
+        results = run_tests(num_tests, literals_list, clauses_list, verify_solutions, decompose)
 
-        save_results(results, output_file)
+        save_results(results, output_file, decompose)
 
     except ValueError:
         print("Error: Please enter valid integer values.")
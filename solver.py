@@ -0,0 +1,46 @@
+def create_implication_graph(num_vars, clauses):
+    """Create the implication graph for the 2SAT problem."""
+    # The graph has 2*num_vars nodes: for each variable i,
+    # node 2*i represents i and node 2*i+1 represents -i
+    n = 2 * num_vars
+    # ten graf nie jest dobrze bo to jest tablica kwadratowa
+    graph = [[] for _ in range(n)]
+
+    # Convert literal to node index
+    def literal_to_node(literal):
+        if literal > 0:
+            return 2 * (literal - 1)
+        else:
+            return 2 * (abs(literal) - 1) + 1
+
+    # For each clause (a or b), add implications (-a => b) and (-b => a)
+    for clause in clauses:
+        a, b = clause
+        not_a = -a
+        not_b = -b
+
+        # Add edge -a => b
+        graph[literal_to_node(not_a)].append(literal_to_node(b))
+
+        # Add edge -b => a
+        graph[literal_to_node(not_b)].append(literal_to_node(a))
+
+    return graph
+
+
+def check_satisfiability(num_vars, sccs):
+    """Check if the 2SAT formula is satisfiable by ensuring no variable and its negation are in the same SCC."""
+    for scc in sccs:
+        # Convert node indices to variable indices
+        var_set = set()
+        for node in scc:
+            var = node // 2
+            is_negated = node % 2 == 1
+            var_set.add((var, is_negated))
+
+        # Check if any variable and its negation are in the same SCC
+        for var, is_negated in var_set:
+            if (var, not is_negated) in var_set:
+                return False
+
+    return True
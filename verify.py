@@ -0,0 +1,78 @@
+import numpy as np
+
+
+def pack_assignment(num_vars, assignment):
+    """
+    Pack an assignment into a boolean array indexed by variable.
+
+    Args:
+        num_vars: Number of variables in the formula
+        assignment: Dictionary mapping each variable to its truth value
+
+    Returns:
+        values: Boolean array of length num_vars + 1, values[var] is the truth
+            value of var (index 0 is unused)
+
+    Raises:
+        ValueError: If the assignment does not cover exactly the variables
+            1..num_vars
+    """
+    # The verifier must never fill in values itself
+    invalid = [var for var in assignment if not 1 <= var <= num_vars]
+    if invalid:
+        raise ValueError(f"Assignment contains {len(invalid)} variable(s) outside 1..{num_vars}, e.g. {sorted(invalid)[:10]}")
+    missing = [var for var in range(1, num_vars + 1) if var not in assignment]
+    if missing:
+        raise ValueError(f"Assignment is missing {len(missing)} variable(s), e.g. {missing[:10]}")
+
+    values = np.zeros(num_vars + 1, dtype=bool)
+    if assignment:
+        variables = np.fromiter(assignment.keys(), dtype=np.int64, count=len(assignment))
+        values[variables] = np.fromiter(assignment.values(), dtype=bool, count=len(assignment))
+    return values
+
+
+def verify(num_vars, clauses, assignment):
+    """
+    Check an assignment against every clause of a 2SAT formula at once.
+
+    Args:
+        num_vars: Number of variables in the formula
+        clauses: List of clauses, each a pair of literals
+        assignment: Dictionary mapping each variable to its truth value, or an
+            array already packed with pack_assignment
+
+    Returns:
+        (passed, violated): passed is True when every clause is satisfied,
+            violated is an array with the indices of the violated clauses
+
+    Raises:
+        ValueError: If the assignment or the clauses are malformed
+    """
+    if isinstance(assignment, np.ndarray):
+        if assignment.shape != (num_vars + 1,) or assignment.dtype != bool:
+            raise ValueError(f"Packed assignment must be a boolean array of shape ({num_vars + 1},), "
+                             f"got {assignment.dtype} array of shape {assignment.shape}")
+        values = assignment
+    else:
+        values = pack_assignment(num_vars, assignment)
+
+    if len(clauses) == 0:
+        return True, np.empty(0, dtype=np.int64)
+
+    try:
+        literals = np.asarray(clauses, dtype=np.int64)
+    except ValueError:
+        raise ValueError("Every clause must contain exactly two literals") from None
+    if literals.ndim != 2 or literals.shape[1] != 2:
+        raise ValueError("Every clause must contain exactly two literals")
+
+    variables = np.abs(literals)
+    if variables.min() == 0 or variables.max() > num_vars:
+        raise ValueError(f"Clauses contain literals outside -{num_vars}..-1, 1..{num_vars}")
+
+    # A literal is true when its variable's value matches its sign
+    literal_values = values[variables] == (literals > 0)
+    violated = np.flatnonzero(~(literal_values[:, 0] | literal_values[:, 1]))
+
+    return violated.size == 0, violated